@@ -12,6 +12,8 @@ The conversion strategies are:
 - Handle graph name to URI conversion with proper validation
 """
 
+from functools import lru_cache
+
 from fastmcp.exceptions import ToolError
 from pyoxigraph import Literal, NamedNode
 
@@ -47,12 +49,14 @@ def create_rdf_node(value: str) -> NamedNode | Literal:
         return Literal(value)  # Fall back to literal
 
 
+@lru_cache(maxsize=1024)
 def create_graph_uri(graph_name: str | None) -> NamedNode | None:
     """Convert simple graph name to namespaced URI.
 
     Creates a NamedNode with the MCP namespace for non-empty graph names.
     Returns None for None or empty string inputs (indicating default graph).
-    Raises error for whitespace-only names which are invalid.
+    Raises error for whitespace-only names which are invalid. Results are
+    memoized, since graph names are drawn from a small set of identifiers.
 
     Args:
         graph_name: The graph name to convert, or None for default graph
@@ -80,7 +84,10 @@ def create_graph_uri(graph_name: str | None) -> NamedNode | None:
     if graph_name is None or graph_name == "":
         return None
 
-    if not graph_name.strip():
-        raise ToolError("Graph name cannot be whitespace-only")
+    # Names almost never carry surrounding whitespace, so only strip (and copy) when an edge needs it
+    if graph_name[0].isspace() or graph_name[-1].isspace():
+        graph_name = graph_name.strip()
+        if not graph_name:
+            raise ToolError("Graph name cannot be whitespace-only")
 
-    return NamedNode(f"{MCP_NAMESPACE}{graph_name.strip()}")
+    return NamedNode(f"{MCP_NAMESPACE}{graph_name}")
@@ -4,6 +4,7 @@ MCP RDF Memory Server
 Model Context Protocol server providing RDF triple store capabilities to LLMs through SPARQL.
 """
 
+from functools import lru_cache
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -25,6 +26,18 @@ from .store_manager import StoreManager
 # Constants
 MCP_NAMESPACE = "http://mcp.local/"
 
+# Standard RDF namespaces available as global prefixes on every server
+STANDARD_PREFIXES: dict[str, str] = {
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "schema": "http://schema.org/",
+}
+
 
 def validate_rdf_identifier(value: str | NamedNode) -> str:
     """Validate and return string representation of RDF identifier."""
@@ -71,6 +84,12 @@ def validate_prefix(prefix: str) -> str:
 
 
 # Helper functions to convert validated strings back to RDF objects
+@lru_cache(maxsize=128)
+def predicate_named_node(iri: str) -> NamedNode:
+    """Return a NamedNode for a predicate IRI, reusing the parsed node for the few predicates in use."""
+    return NamedNode(iri)
+
+
 def create_rdf_node(value: str) -> NamedNode | Literal:
     """Convert validated string to appropriate RDF node type."""
     try:
@@ -79,13 +98,17 @@ def create_rdf_node(value: str) -> NamedNode | Literal:
         return Literal(value)  # Fall back to literal
 
 
+@lru_cache(maxsize=1024)
 def create_graph_uri(graph_name: str | None) -> NamedNode | None:
-    """Convert simple graph name to namespaced URI."""
+    """Convert simple graph name to namespaced URI, reusing the node for repeated names."""
     if graph_name is None or graph_name == "":
         return None
-    if not graph_name.strip():
-        raise ToolError("Graph name cannot be whitespace-only")
-    return NamedNode(f"http://mcp.local/{graph_name.strip()}")
+    # Only strip (and copy) when an edge character is whitespace
+    if graph_name[0].isspace() or graph_name[-1].isspace():
+        graph_name = graph_name.strip()
+        if not graph_name:
+            raise ToolError("Graph name cannot be whitespace-only")
+    return NamedNode(f"{MCP_NAMESPACE}{graph_name}")
 
 
 def is_curie(value: str) -> bool:
@@ -182,16 +205,7 @@ class RDFMemoryServer:
         self.store_manager = StoreManager(store_path)
 
         # Initialize prefix storage with standard RDF namespaces
-        self.global_prefixes: dict[str, str] = {
-            "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-            "owl": "http://www.w3.org/2002/07/owl#",
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "foaf": "http://xmlns.com/foaf/0.1/",
-            "dc": "http://purl.org/dc/elements/1.1/",
-            "dcterms": "http://purl.org/dc/terms/",
-            "schema": "http://schema.org/",
-        }
+        self.global_prefixes: dict[str, str] = STANDARD_PREFIXES.copy()
         self.graph_prefixes: dict[str, dict[str, str]] = {}
 
     @property
@@ -270,7 +284,7 @@ class RDFMemoryServer:
 
             # Convert validated strings to RDF objects
             subject_node = NamedNode(expanded_subject)
-            predicate_node = NamedNode(expanded_predicate)
+            predicate_node = predicate_named_node(expanded_predicate)
             object_node = create_rdf_node(expanded_object)
             graph_node = create_graph_uri(triple.graph_name)
 
@@ -296,7 +310,7 @@ class RDFMemoryServer:
         Use rdf_sparql_query for complex queries."""
         # Convert validated strings to RDF objects for pattern matching
         subject_node = NamedNode(subject) if subject else None
-        predicate_node = NamedNode(predicate) if predicate else None
+        predicate_node = predicate_named_node(predicate) if predicate else None
         object_node = create_rdf_node(object) if object else None
         graph_node = create_graph_uri(graph_name)
 
@@ -316,8 +330,9 @@ class RDFMemoryServer:
             else:
                 graph_name = quad.graph_name.value
 
+            # Terms come straight from the store, so skip re-validating each row
             results.append(
-                QuadResult(
+                QuadResult.model_construct(
                     subject=str(quad.subject),
                     predicate=str(quad.predicate),
                     object=str(quad.object),
@@ -370,7 +385,7 @@ class RDFMemoryServer:
 
         # CONSTRUCT/DESCRIBE query returns QueryTriples - convert to QuadResult list
         construct_results = [
-            QuadResult(
+            QuadResult.model_construct(
                 subject=str(triple.subject),
                 predicate=str(triple.predicate),
                 object=str(triple.object),
@@ -10,6 +10,11 @@ Functions are organized into:
 - RDF validation: Functions that work with RDF types and concepts
 """
 
+import string
+
+# Bytes allowed in a prefix; deleting them with bytes.translate leaves only invalid characters
+_PREFIX_BYTES = (string.ascii_letters + string.digits + "_-").encode("ascii")
+
 
 def is_empty_or_whitespace(value: str) -> bool:
     """Check if a string is empty or contains only whitespace.
@@ -69,21 +74,18 @@ def validate_prefix(prefix: str) -> str:
     if is_empty_or_whitespace(prefix):
         raise ValueError("Prefix cannot be empty or whitespace-only")
 
-    # Trim whitespace first
-    trimmed_prefix = prefix.strip()
-
-    # Check again after trimming in case it becomes empty
-    if not trimmed_prefix:
-        raise ValueError("Prefix cannot be empty or whitespace-only")
+    # Trim whitespace first, only copying when an edge character is whitespace
+    trimmed_prefix = prefix.strip() if prefix[0].isspace() or prefix[-1].isspace() else prefix
 
     # Prefix should not contain colons (that's for CURIEs)
     if ":" in trimmed_prefix:
         raise ValueError("Prefix should not contain colons")
 
-    # Should be a valid identifier pattern
-    # Use same logic as CURIE validation but check entire string
-    for char in trimmed_prefix:
-        if not (char.isascii() and (char.isalnum() or char in "_-")):
-            raise ValueError("Prefix must contain only ASCII letters, numbers, hyphens, and underscores")
+    # Common prefixes like "rdf" or "schema" are plain ASCII alphanumerics; anything
+    # else is checked in a single C-level pass over its ASCII bytes
+    if trimmed_prefix.isascii() and (
+        trimmed_prefix.isalnum() or not trimmed_prefix.encode("ascii").translate(None, _PREFIX_BYTES)
+    ):
+        return trimmed_prefix
 
-    return trimmed_prefix
+    raise ValueError("Prefix must contain only ASCII letters, numbers, hyphens, and underscores")
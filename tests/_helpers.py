@@ -0,0 +1,71 @@
+"""
+Shared helpers for unwrapping MCP tool and resource results in tests.
+"""
+
+from typing import Any
+
+from fastmcp import Client
+from mcp.types import TextContent, TextResourceContents
+from pydantic_core import from_json
+
+from mcp_rdf_memory.server import FindTriplesResult, QuadResult
+
+__all__ = [
+    "assert_all_substrings",
+    "one_text",
+    "parse_quads",
+    "parse_sparql_result",
+    "read_json_resource",
+    "read_text_resource",
+    "sparql_ask",
+]
+
+
+def one_text(result) -> str:
+    """Return the text of a tool result holding exactly one TextContent."""
+    __tracebackhide__ = True
+    assert len(result) == 1, "Expected exactly one result"
+    assert isinstance(result[0], TextContent), f"Expected TextContent but got {type(result[0])}"
+    return result[0].text
+
+
+def parse_sparql_result(result) -> list[dict[str, str]]:
+    """Parse SPARQL query result with proper type checking."""
+    __tracebackhide__ = True
+    return from_json(one_text(result))
+
+
+def parse_quads(result) -> list[QuadResult]:
+    """Decode a quad list result and validate it against QuadResult in a single pass."""
+    __tracebackhide__ = True
+    return FindTriplesResult.model_validate_json(one_text(result)).root
+
+
+async def sparql_ask(client: Client, query: str) -> bool:
+    """Run a SPARQL ASK query and return its boolean answer."""
+    __tracebackhide__ = True
+    answer = from_json(one_text(await client.call_tool("rdf_sparql_query", {"query": query})))
+    assert isinstance(answer, bool), f"Expected ASK result but got {answer!r}"
+    return answer
+
+
+async def read_text_resource(client: Client, uri: str) -> str:
+    """Get text content from a resource URI."""
+    __tracebackhide__ = True
+    result = await client.read_resource(uri)
+    assert len(result) == 1
+    assert isinstance(result[0], TextResourceContents)
+    return result[0].text
+
+
+async def read_json_resource(client: Client, uri: str) -> Any:
+    """Get parsed JSON content from a resource URI."""
+    __tracebackhide__ = True
+    return from_json(await read_text_resource(client, uri))
+
+
+def assert_all_substrings(text: str, *needles: str) -> None:
+    """Assert that every needle occurs in text."""
+    __tracebackhide__ = True
+    for needle in needles:
+        assert needle in text, f"Expected {needle!r} in result"
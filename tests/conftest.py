@@ -7,22 +7,76 @@ from collections.abc import AsyncGenerator
 import pytest
 import pytest_asyncio
 from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
 
-from mcp_rdf_memory.server import RDFMemoryServer, register_mcp_server
+from mcp_rdf_memory.server import STANDARD_PREFIXES, RDFMemoryServer, register_mcp_server
 
 
-@pytest_asyncio.fixture
-async def client() -> AsyncGenerator[Client, None]:
-    """Provide a FastMCP client for testing."""
-    # Create fresh in-memory server instance for each test
-    server = RDFMemoryServer(store_path=None)  # In-memory store
+@pytest.fixture(scope="session")
+def server() -> RDFMemoryServer:
+    """Provide the in-memory server instance shared by the whole test session."""
+    return RDFMemoryServer(store_path=None)  # In-memory store
+
+
+@pytest.fixture(scope="session")
+def mcp(server: RDFMemoryServer) -> FastMCP:
+    """Provide the FastMCP instance with the shared server's tools and resources registered."""
     mcp = FastMCP("RDF Memory Test")
     register_mcp_server(server, mcp)
+    return mcp
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(mcp: FastMCP) -> AsyncGenerator[Client, None]:
+    """Provide a FastMCP client connected to the server in-process.
 
-    async with Client(mcp) as client:
+    FastMCPTransport dispatches straight to the server over in-memory streams,
+    so no subprocess, stdio pipe, or socket sits between tests and the tools.
+    """
+    # Server and transport are started once; reset_server keeps tests isolated
+    async with Client(FastMCPTransport(mcp)) as client:
         yield client
 
 
+def reset_server_state(server: RDFMemoryServer) -> None:
+    """Clear the store and restore the default prefix maps."""
+    assert server.store is not None
+    server.store.clear()
+    server.global_prefixes.clear()
+    server.global_prefixes.update(STANDARD_PREFIXES)
+    server.graph_prefixes.clear()
+
+
+# Name of the module whose SEED_TRIPLES the shared store currently holds, if any
+SEEDED_MODULE = pytest.StashKey[str | None]()
+
+
+@pytest.fixture(autouse=True)
+def reset_server(request: pytest.FixtureRequest, server: RDFMemoryServer) -> None:
+    """Restore the shared server to a fresh state before each test.
+
+    Tests using seeded_client share one seeded store instead.
+    """
+    if "seeded_client" in request.fixturenames:
+        return
+    reset_server_state(server)
+    request.config.stash[SEEDED_MODULE] = None
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def seeded_client(request: pytest.FixtureRequest, client: Client, server: RDFMemoryServer) -> Client:
+    """Provide the client with the module's SEED_TRIPLES added in a single batch.
+
+    The store is only reseeded when another module or a test resetting the server
+    has touched it since, so tests using it must only read.
+    """
+    if request.config.stash.get(SEEDED_MODULE, None) != request.module.__name__:
+        reset_server_state(server)
+        await client.call_tool("rdf_add_triples", {"triples": request.module.SEED_TRIPLES})
+        request.config.stash[SEEDED_MODULE] = request.module.__name__
+    return client
+
+
 @pytest.fixture
 def sample_triple() -> dict[str, str]:
     """Provide a sample RDF triple for testing."""
@@ -25,6 +25,29 @@ HIERARCHICAL_NAMES = [
 
 WHITESPACE_ONLY_STRINGS = [" ", "  ", "\t", "\n", "\r", "\r\n", "   \t  ", "\t\n  \r  \n\t"]
 
+# (input, expected trimmed name) pairs, built once at import rather than per test
+TRIMMING_CASES = (
+    ("  test-graph  ", "test-graph"),
+    ("\tconversation\t", "conversation"),
+    ("\nproject\n", "project"),
+    ("   conversation/chat-123   ", "conversation/chat-123"),
+    ("\t\n  mixed-whitespace  \n\t", "mixed-whitespace"),
+)
+
+SPECIAL_CHARACTER_NAMES = (
+    "graph-with-dashes",
+    "graph_with_underscores",
+    "graph123with456numbers",
+    "graph.with.dots",
+)
+
+UNICODE_NAMES = (
+    "café-graph",
+    "naïve-data",
+    "中文图表",
+    "русский-граф",
+)
+
 
 # Fixtures for reusable test data
 @pytest.fixture
@@ -33,18 +56,6 @@ def expected_namespace():
     return "http://mcp.local/"
 
 
-@pytest.fixture
-def trimming_test_cases():
-    """Provide test cases for whitespace trimming."""
-    return [
-        ("  test-graph  ", "test-graph"),
-        ("\tconversation\t", "conversation"),
-        ("\nproject\n", "project"),
-        ("   conversation/chat-123   ", "conversation/chat-123"),
-        ("\t\n  mixed-whitespace  \n\t", "mixed-whitespace"),
-    ]
-
-
 # Default behavior tests
 def test_none_input_returns_none() -> None:
     """None input should return None for default graph."""
@@ -78,9 +89,9 @@ def test_creates_hierarchical_uris(name: str, expected_namespace: str) -> None:
     assert "/" in result.value  # Verify hierarchy is preserved
 
 
-def test_trims_whitespace_from_input(trimming_test_cases, expected_namespace: str) -> None:
+def test_trims_whitespace_from_input(expected_namespace: str) -> None:
     """Leading and trailing whitespace should be trimmed."""
-    for input_name, expected_clean_name in trimming_test_cases:
+    for input_name, expected_clean_name in TRIMMING_CASES:
         result = create_graph_uri(input_name)
 
         assert isinstance(result, NamedNode)
@@ -89,14 +100,7 @@ def test_trims_whitespace_from_input(trimming_test_cases, expected_namespace: st
 
 def test_preserves_valid_special_characters(expected_namespace: str) -> None:
     """Valid special characters should be preserved in URIs."""
-    valid_names = [
-        "graph-with-dashes",
-        "graph_with_underscores",
-        "graph123with456numbers",
-        "graph.with.dots",
-    ]
-
-    for name in valid_names:
+    for name in SPECIAL_CHARACTER_NAMES:
         result = create_graph_uri(name)
 
         assert isinstance(result, NamedNode)
@@ -107,11 +111,9 @@ def test_preserves_valid_special_characters(expected_namespace: str) -> None:
 @pytest.mark.parametrize("whitespace_name", WHITESPACE_ONLY_STRINGS, ids=lambda x: f"whitespace_{x!r}")
 def test_rejects_whitespace_only_names(whitespace_name: str) -> None:
     """Whitespace-only names should raise ToolError."""
-    with pytest.raises(ToolError) as exc_info:
+    with pytest.raises(ToolError, match="Graph name cannot be whitespace-only"):
         create_graph_uri(whitespace_name)
 
-    assert "Graph name cannot be whitespace-only" in str(exc_info.value)
-
 
 @pytest.mark.parametrize(
     "invalid_name",
@@ -130,13 +132,9 @@ def test_rejects_invalid_iri_characters(invalid_name: str) -> None:
 
 def test_error_message_is_descriptive() -> None:
     """Error messages should be clear and helpful."""
-    with pytest.raises(ToolError) as exc_info:
+    with pytest.raises(ToolError, match="Graph name.*whitespace-only"):
         create_graph_uri("   ")
 
-    error_message = str(exc_info.value)
-    assert "Graph name" in error_message
-    assert "whitespace-only" in error_message
-
 
 # Consistency and edge case tests
 def test_namespace_consistency(expected_namespace: str) -> None:
@@ -170,14 +168,7 @@ def test_handles_edge_case_valid_names(name: str, expected_namespace: str) -> No
 
 def test_unicode_support(expected_namespace: str) -> None:
     """Unicode characters should be supported in graph names."""
-    unicode_names = [
-        "café-graph",
-        "naïve-data",
-        "中文图表",
-        "русский-граф",
-    ]
-
-    for name in unicode_names:
+    for name in UNICODE_NAMES:
         result = create_graph_uri(name)
 
         assert isinstance(result, NamedNode)
@@ -1,44 +1,28 @@
 """Tests for RDF prefix management functionality."""
 
-import json
+import asyncio
+import re
 
 import pytest
 from fastmcp.client.client import Client
-from mcp.types import TextContent, TextResourceContents
+from fastmcp.exceptions import ToolError
 
+from tests._helpers import parse_sparql_result, read_json_resource
 
-def assert_tool_returns_empty(result) -> None:
-    """Assert that tool call result is empty (tool returned None)."""
-    __tracebackhide__ = True
-    assert len(result) == 0
+# Rejection messages for bad prefixes and namespace URIs
+_INVALID_PREFIX = re.compile(r"colon|invalid prefix", re.IGNORECASE)
+_INVALID_NAMESPACE = re.compile(r"invalid namespace URI", re.IGNORECASE)
 
-
-def parse_sparql_result(result) -> list[dict[str, str]]:
-    """Parse SPARQL query result with proper type checking."""
-    __tracebackhide__ = True
-    assert len(result) == 1, "Expected exactly one result"
-    assert isinstance(result[0], TextContent), f"Expected TextContent but got {type(result[0])}"
-    return json.loads(result[0].text)
+# Query returning every stored triple, shared by the CURIE expansion tests
+QUERY_ALL_TRIPLES = "SELECT ?s ?p ?o WHERE { ?s ?p ?o . }"
 
 
-async def get_prefixes_from_resource(client: Client, uri: str) -> dict[str, str]:
-    """Get prefixes from a resource URI."""
+def assert_tool_returns_empty(result) -> None:
+    """Assert that tool call result is empty (tool returned None)."""
     __tracebackhide__ = True
-    result = await client.read_resource(uri)
-    assert len(result) == 1
-    assert isinstance(result[0], TextResourceContents)
-    return json.loads(result[0].text)
-
-
-@pytest.mark.asyncio
-async def test_rdf_define_prefix_tool_available(client: Client):
-    """Test that the rdf_define_prefix tool is available."""
-    tools = await client.list_tools()
-    tool_names = [tool.name for tool in tools]
-    assert "rdf_define_prefix" in tool_names
+    assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_define_global_prefix(client: Client):
     """Test defining a global prefix."""
     result = await client.call_tool(
@@ -48,12 +32,11 @@ async def test_define_global_prefix(client: Client):
     assert_tool_returns_empty(result)
 
     # Verify prefix was added via resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/prefix")
     assert "method" in prefixes
     assert prefixes["method"] == "http://example.org/methods/"
 
 
-@pytest.mark.asyncio
 async def test_define_graph_specific_prefix(client: Client):
     """Test defining a graph-specific prefix."""
     result = await client.call_tool(
@@ -64,12 +47,11 @@ async def test_define_graph_specific_prefix(client: Client):
     assert_tool_returns_empty(result)
 
     # Verify prefix was added via resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/test-graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/test-graph/prefix")
     assert "rel" in prefixes
     assert prefixes["rel"] == "http://example.org/relations/"
 
 
-@pytest.mark.asyncio
 async def test_remove_global_prefix(client: Client):
     """Test removing a global prefix."""
     # First define a prefix
@@ -81,11 +63,10 @@ async def test_remove_global_prefix(client: Client):
     assert_tool_returns_empty(result)
 
     # Verify prefix was removed via resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/prefix")
     assert "test" not in prefixes
 
 
-@pytest.mark.asyncio
 async def test_remove_graph_specific_prefix(client: Client):
     """Test removing a graph-specific prefix."""
     # First define a graph-specific prefix
@@ -99,11 +80,10 @@ async def test_remove_graph_specific_prefix(client: Client):
     assert_tool_returns_empty(result)
 
     # Verify prefix was removed via resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/test-graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/test-graph/prefix")
     assert "test" not in prefixes
 
 
-@pytest.mark.asyncio
 async def test_remove_nonexistent_prefix(client: Client):
     """Test removing a prefix that doesn't exist."""
     result = await client.call_tool("rdf_define_prefix", {"prefix": "nonexistent"})
@@ -112,39 +92,30 @@ async def test_remove_nonexistent_prefix(client: Client):
     assert_tool_returns_empty(result)
 
 
-@pytest.mark.asyncio
-async def test_invalid_prefix_format(client: Client):
+@pytest.mark.parametrize("prefix", ["invalid:prefix", "has space", "bad/prefix", ""])
+async def test_invalid_prefix_format(client: Client, prefix: str):
     """Test that invalid prefix formats are rejected."""
-    with pytest.raises(Exception) as exc_info:
-        await client.call_tool(
-            "rdf_define_prefix", {"prefix": "invalid:prefix", "namespace_uri": "http://example.org/"}
-        )
-
-    # The error should mention colons are not allowed
-    error_msg = str(exc_info.value).lower()
-    assert "colon" in error_msg or "invalid prefix" in error_msg
+    with pytest.raises(ToolError, match=_INVALID_PREFIX):
+        await client.call_tool("rdf_define_prefix", {"prefix": prefix, "namespace_uri": "http://example.org/"})
 
 
-@pytest.mark.asyncio
-async def test_invalid_namespace_uri(client: Client):
+@pytest.mark.parametrize("namespace_uri", ["not-a-valid-uri", "http://example.org/has space/"])
+async def test_invalid_namespace_uri(client: Client, namespace_uri: str):
     """Test that invalid namespace URIs are rejected."""
-    with pytest.raises(Exception) as exc_info:
-        await client.call_tool("rdf_define_prefix", {"prefix": "test", "namespace_uri": "not-a-valid-uri"})
+    with pytest.raises(ToolError, match=_INVALID_NAMESPACE):
+        await client.call_tool("rdf_define_prefix", {"prefix": "test", "namespace_uri": namespace_uri})
 
-    # The error should mention invalid URI
-    error_msg = str(exc_info.value)
-    assert "Invalid namespace URI" in error_msg or "invalid" in error_msg.lower()
 
-
-@pytest.mark.asyncio
 async def test_global_prefix_resource(client: Client):
     """Test reading global prefixes via resource."""
-    # Define some global prefixes
-    await client.call_tool("rdf_define_prefix", {"prefix": "ex", "namespace_uri": "http://example.org/"})
-    await client.call_tool("rdf_define_prefix", {"prefix": "test", "namespace_uri": "http://test.org/"})
+    # Define some global prefixes; the calls are independent, so send them together
+    await asyncio.gather(
+        client.call_tool("rdf_define_prefix", {"prefix": "ex", "namespace_uri": "http://example.org/"}),
+        client.call_tool("rdf_define_prefix", {"prefix": "test", "namespace_uri": "http://test.org/"}),
+    )
 
     # Read the global prefix resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/prefix")
 
     assert "ex" in prefixes
     assert "test" in prefixes
@@ -152,17 +123,18 @@ async def test_global_prefix_resource(client: Client):
     assert prefixes["test"] == "http://test.org/"
 
 
-@pytest.mark.asyncio
 async def test_graph_specific_prefix_resource(client: Client):
     """Test reading graph-specific prefixes via resource."""
     # Define global and graph-specific prefixes
-    await client.call_tool("rdf_define_prefix", {"prefix": "global", "namespace_uri": "http://global.org/"})
-    await client.call_tool(
-        "rdf_define_prefix", {"prefix": "local", "namespace_uri": "http://local.org/", "graph_name": "test-graph"}
+    await asyncio.gather(
+        client.call_tool("rdf_define_prefix", {"prefix": "global", "namespace_uri": "http://global.org/"}),
+        client.call_tool(
+            "rdf_define_prefix", {"prefix": "local", "namespace_uri": "http://local.org/", "graph_name": "test-graph"}
+        ),
     )
 
     # Read the graph-specific prefix resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/test-graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/test-graph/prefix")
 
     # Should include both global and graph-specific prefixes
     assert "global" in prefixes
@@ -171,7 +143,6 @@ async def test_graph_specific_prefix_resource(client: Client):
     assert prefixes["local"] == "http://local.org/"
 
 
-@pytest.mark.asyncio
 async def test_graph_specific_prefix_overrides_global(client: Client):
     """Test that graph-specific prefixes override global ones."""
     # Define a global prefix
@@ -183,17 +154,16 @@ async def test_graph_specific_prefix_overrides_global(client: Client):
     )
 
     # Read the graph-specific prefix resource
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/test-graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/test-graph/prefix")
 
     # Graph-specific should override global
     assert prefixes["test"] == "http://local.org/"
 
 
-@pytest.mark.asyncio
 async def test_standard_prefix_resources(client: Client):
     """Test that standard RDF namespaces are pre-populated."""
     # Read global prefixes (should contain standard namespaces)
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/prefix")
 
     # Verify standard namespaces are present
     assert "rdf" in prefixes
@@ -206,11 +176,10 @@ async def test_standard_prefix_resources(client: Client):
     assert prefixes["schema"] == "http://schema.org/"
 
     # Read graph-specific prefixes (should include global prefixes)
-    prefixes = await get_prefixes_from_resource(client, "rdf://graph/nonexistent/prefix")
+    prefixes = await read_json_resource(client, "rdf://graph/nonexistent/prefix")
     assert "rdf" in prefixes  # Global prefixes are included
 
 
-@pytest.mark.asyncio
 async def test_curie_expansion_stores_expanded_iris(client: Client):
     """Test that CURIEs are expanded to full IRIs when storing triples."""
     # Define prefix
@@ -222,7 +191,7 @@ async def test_curie_expansion_stores_expanded_iris(client: Client):
     )
 
     # Query to check what's actually stored
-    result = await client.call_tool("rdf_sparql_query", {"query": "SELECT ?s ?p ?o WHERE { ?s ?p ?o . }"})
+    result = await client.call_tool("rdf_sparql_query", {"query": QUERY_ALL_TRIPLES})
 
     raw_data = parse_sparql_result(result)
     assert len(raw_data) == 1, "Expected exactly one triple"
@@ -234,7 +203,6 @@ async def test_curie_expansion_stores_expanded_iris(client: Client):
     assert "http://example.org/bob" in triple["o"]
 
 
-@pytest.mark.asyncio
 async def test_expanded_curies_match_sparql_prefix_queries(client: Client):
     """Test that expanded CURIEs can be found by SPARQL queries using prefixes."""
     # Define prefix
@@ -263,7 +231,6 @@ async def test_expanded_curies_match_sparql_prefix_queries(client: Client):
     assert "http://example.org/bob" in friend
 
 
-@pytest.mark.asyncio
 async def test_curie_expansion_with_literal_objects(client: Client):
     """Test that CURIE expansion works correctly when objects are literals."""
     # Define prefix
@@ -276,7 +243,7 @@ async def test_curie_expansion_with_literal_objects(client: Client):
     )
 
     # Query to verify expansion
-    result = await client.call_tool("rdf_sparql_query", {"query": "SELECT ?s ?p ?o WHERE { ?s ?p ?o . }"})
+    result = await client.call_tool("rdf_sparql_query", {"query": QUERY_ALL_TRIPLES})
 
     data = parse_sparql_result(result)
     assert len(data) == 1
@@ -287,7 +254,6 @@ async def test_curie_expansion_with_literal_objects(client: Client):
     assert data[0]["o"] == '"Alice Smith"'  # Literal with quotes
 
 
-@pytest.mark.asyncio
 async def test_prefix_expansion_with_undefined_prefix(client: Client):
     """Test that CURIEs with undefined prefixes are stored as-is."""
     # Add triple using CURIE notation WITHOUT defining the prefix first
@@ -297,7 +263,7 @@ async def test_prefix_expansion_with_undefined_prefix(client: Client):
     )
 
     # Query to see what was stored
-    result = await client.call_tool("rdf_sparql_query", {"query": "SELECT ?s ?p ?o WHERE { ?s ?p ?o . }"})
+    result = await client.call_tool("rdf_sparql_query", {"query": QUERY_ALL_TRIPLES})
 
     raw_data = parse_sparql_result(result)
     assert len(raw_data) > 0
@@ -309,7 +275,6 @@ async def test_prefix_expansion_with_undefined_prefix(client: Client):
     assert "undefined:bob" in triple["o"]
 
 
-@pytest.mark.asyncio
 async def test_prefix_expansion_with_standard_namespaces(client: Client):
     """Test that standard RDF namespaces are pre-populated and work correctly."""
     # Add triple using standard namespace CURIEs (no need to define them)
@@ -334,7 +299,6 @@ async def test_prefix_expansion_with_standard_namespaces(client: Client):
     assert "http://example.org/person/john" in query_data[0]["person"]
 
 
-@pytest.mark.asyncio
 async def test_graph_specific_prefix_overrides_global_during_expansion(client: Client):
     """Test that graph-specific prefixes override global prefixes during CURIE expansion."""
     # Define global prefix
@@ -374,7 +338,6 @@ async def test_graph_specific_prefix_overrides_global_during_expansion(client: C
     assert "http://local.org/value" in data[0]["o"]
 
 
-@pytest.mark.asyncio
 async def test_global_prefix_used_in_default_graph(client: Client):
     """Test that global prefixes are used for default graph expansion."""
     # Define global prefix
@@ -387,7 +350,7 @@ async def test_global_prefix_used_in_default_graph(client: Client):
     )
 
     # Query to verify correct expansion
-    result = await client.call_tool("rdf_sparql_query", {"query": "SELECT ?s ?p ?o WHERE { ?s ?p ?o . }"})
+    result = await client.call_tool("rdf_sparql_query", {"query": QUERY_ALL_TRIPLES})
 
     data = parse_sparql_result(result)
     assert len(data) == 1
@@ -2,20 +2,13 @@
 Tests for the rdf_rdf_add_triples tool.
 """
 
+import asyncio
+
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
 
 
-@pytest.mark.asyncio
-async def test_rdf_add_triples_tool_available(client: Client) -> None:
-    """Test that rdf_add_triples tool is available."""
-    tools = await client.list_tools()
-    tool_names = [tool.name for tool in tools]
-    assert "rdf_add_triples" in tool_names
-
-
-@pytest.mark.asyncio
 async def test_add_simple_triple(client: Client) -> None:
     """Test adding a basic RDF triple."""
     result = await client.call_tool(
@@ -35,7 +28,6 @@ async def test_add_simple_triple(client: Client) -> None:
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_add_triple_with_named_graph(client: Client, sample_graph_uri: str) -> None:
     """Test adding a triple to a specific named graph context."""
     result = await client.call_tool(
@@ -56,7 +48,6 @@ async def test_add_triple_with_named_graph(client: Client, sample_graph_uri: str
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_add_triple_with_uri_object(client: Client) -> None:
     """Test adding a triple where the object is also a URI."""
     result = await client.call_tool(
@@ -76,7 +67,6 @@ async def test_add_triple_with_uri_object(client: Client) -> None:
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_add_multiple_triples(client: Client) -> None:
     """Test adding multiple triples in a single call."""
     result = await client.call_tool(
@@ -106,7 +96,6 @@ async def test_add_multiple_triples(client: Client) -> None:
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_add_triple_validation_error(client: Client) -> None:
     """Test that invalid URIs are properly validated."""
     with pytest.raises(ToolError):  # Should raise ToolError via FastMCP
@@ -116,7 +105,6 @@ async def test_add_triple_validation_error(client: Client) -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_rdf_add_triples_invalid_identifiers(client: Client) -> None:
     """Test that truly invalid RDF identifiers raise appropriate errors."""
     invalid_identifiers = [
@@ -141,7 +129,6 @@ async def test_rdf_add_triples_invalid_identifiers(client: Client) -> None:
             )
 
 
-@pytest.mark.asyncio
 async def test_rdf_add_triples_valid_curie_and_urn(client: Client) -> None:
     """Test that CURIEs and URNs are accepted as valid identifiers."""
     valid_identifiers = [
@@ -154,31 +141,33 @@ async def test_rdf_add_triples_valid_curie_and_urn(client: Client) -> None:
         "file:///local/path",
     ]
 
-    for identifier in valid_identifiers:
-        # Should not raise error
-        result = await client.call_tool(
-            "rdf_add_triples",
-            {
-                "triples": [
-                    {
-                        "subject": "http://example.org/test",
-                        "predicate": identifier,
-                        "object": "Test Value",
-                    }
-                ]
-            },
+    # Each identifier is sent in its own call so a rejection points at it; none should raise
+    results = await asyncio.gather(
+        *(
+            client.call_tool(
+                "rdf_add_triples",
+                {
+                    "triples": [
+                        {
+                            "subject": "http://example.org/test",
+                            "predicate": identifier,
+                            "object": "Test Value",
+                        }
+                    ]
+                },
+            )
+            for identifier in valid_identifiers
         )
-        assert len(result) == 0
+    )
+    assert all(len(result) == 0 for result in results)
 
 
-@pytest.mark.asyncio
 async def test_rdf_add_triples_empty_list(client: Client) -> None:
     """Test that empty triple list is handled gracefully."""
     result = await client.call_tool("rdf_add_triples", {"triples": []})
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_rdf_add_triples_missing_fields(client: Client) -> None:
     """Test that missing required fields raise validation errors."""
     # Missing subject
@@ -210,7 +199,6 @@ async def test_rdf_add_triples_missing_fields(client: Client) -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_rdf_add_triples_invalid_graph_uri(client: Client) -> None:
     """Test that whitespace-only graph names raise errors."""
     with pytest.raises(ToolError):
@@ -229,7 +217,6 @@ async def test_rdf_add_triples_invalid_graph_uri(client: Client) -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_rdf_add_triples_invalid_predicate(client: Client) -> None:
     """Test that invalid predicates raise errors."""
     with pytest.raises(ToolError):
@@ -5,96 +5,63 @@ Tests for the rdf_sparql_query tool.
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
-from mcp.types import TextContent
 
-
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_tool_available(client: Client) -> None:
-    """Test that rdf_sparql_query tool is available."""
-    tools = await client.list_tools()
-    tool_names = [tool.name for tool in tools]
-    assert "rdf_sparql_query" in tool_names
-
-
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_select(client: Client) -> None:
+from tests._helpers import one_text
+
+QUERY_ALL_NAMES = "SELECT ?name WHERE { ?person <http://schema.org/name> ?name }"
+
+# Data for the read-only query tests, added once for the module
+SEED_TRIPLES = [
+    {
+        "subject": "http://example.org/person/sparql1",
+        "predicate": "http://schema.org/name",
+        "object": "SPARQL Person One",
+    },
+    {
+        "subject": "http://example.org/person/sparql2",
+        "predicate": "http://schema.org/name",
+        "object": "SPARQL Person Two",
+    },
+    {"subject": "http://example.org/person/test_ask", "predicate": "http://schema.org/name", "object": "Test Person"},
+    {
+        "subject": "http://example.org/person/construct_test",
+        "predicate": "http://schema.org/name",
+        "object": "Construct Test Person",
+    },
+    {
+        "subject": "http://example.org/person/graph_test",
+        "predicate": "http://schema.org/name",
+        "object": "Graph Test Person",
+        "graph_name": "conversation/test-123",
+    },
+]
+
+
+async def test_rdf_sparql_query_select(seeded_client: Client) -> None:
     """Test SPARQL SELECT query."""
-    # First add some test data
-    await client.call_tool(
-        "rdf_add_triples",
-        {
-            "triples": [
-                {
-                    "subject": "http://example.org/person/sparql1",
-                    "predicate": "http://schema.org/name",
-                    "object": "SPARQL Person One",
-                },
-                {
-                    "subject": "http://example.org/person/sparql2",
-                    "predicate": "http://schema.org/name",
-                    "object": "SPARQL Person Two",
-                },
-            ]
-        },
-    )
-
     # Query for all names
-    result = await client.call_tool(
-        "rdf_sparql_query", {"query": "SELECT ?name WHERE { ?person <http://schema.org/name> ?name }"}
-    )
+    result = await seeded_client.call_tool("rdf_sparql_query", {"query": QUERY_ALL_NAMES})
 
-    assert len(result) == 1
-    assert isinstance(result[0], TextContent)
-    assert "SPARQL Person One" in result[0].text
-    assert "SPARQL Person Two" in result[0].text
+    text = one_text(result)
+    assert "SPARQL Person One" in text
+    assert "SPARQL Person Two" in text
 
 
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_ask(client: Client) -> None:
+async def test_rdf_sparql_query_ask(seeded_client: Client) -> None:
     """Test SPARQL ASK query."""
-    # Add test data
-    await client.call_tool(
-        "rdf_add_triples",
-        {
-            "triples": [
-                {
-                    "subject": "http://example.org/person/test_ask",
-                    "predicate": "http://schema.org/name",
-                    "object": "Test Person",
-                }
-            ]
-        },
-    )
-
     # ASK if the person exists
-    result = await client.call_tool(
+    result = await seeded_client.call_tool(
         "rdf_sparql_query", {"query": "ASK { <http://example.org/person/test_ask> <http://schema.org/name> ?name }"}
     )
 
-    assert len(result) == 1
-    assert isinstance(result[0], TextContent)
-    assert "true" in result[0].text.lower()
+    text = one_text(result)
+    assert "true" in text.lower()
 
 
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_construct(client: Client) -> None:
+async def test_rdf_sparql_query_construct(seeded_client: Client) -> None:
     """Test SPARQL CONSTRUCT query."""
-    # Add test data
-    await client.call_tool(
-        "rdf_add_triples",
-        {
-            "triples": [
-                {
-                    "subject": "http://example.org/person/construct_test",
-                    "predicate": "http://schema.org/name",
-                    "object": "Construct Test Person",
-                }
-            ]
-        },
-    )
-
     # CONSTRUCT new triples
-    result = await client.call_tool(
+    result = await seeded_client.call_tool(
         "rdf_sparql_query",
         {
             "query": """
@@ -104,49 +71,23 @@ async def test_rdf_sparql_query_construct(client: Client) -> None:
         },
     )
 
-    assert len(result) == 1
-    assert isinstance(result[0], TextContent)
-    assert "hasName" in result[0].text
-    assert "Construct Test Person" in result[0].text
+    text = one_text(result)
+    assert "hasName" in text
+    assert "Construct Test Person" in text
 
 
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_with_named_graph(client: Client, sample_graph_uri: str) -> None:
+async def test_rdf_sparql_query_with_named_graph(seeded_client: Client, sample_graph_uri: str) -> None:
     """Test SPARQL query with named graph."""
-    # Add data to named graph
-    await client.call_tool(
-        "rdf_add_triples",
-        {
-            "triples": [
-                {
-                    "subject": "http://example.org/person/graph_test",
-                    "predicate": "http://schema.org/name",
-                    "object": "Graph Test Person",
-                    "graph_name": "conversation/test-123",
-                }
-            ]
-        },
-    )
-
     # Query specific graph
-    result = await client.call_tool(
+    result = await seeded_client.call_tool(
         "rdf_sparql_query",
         {"query": f"SELECT ?name FROM <{sample_graph_uri}> WHERE {{ ?person <http://schema.org/name> ?name }}"},
     )
 
-    assert len(result) == 1
-    assert isinstance(result[0], TextContent)
-    assert "Graph Test Person" in result[0].text
-
-
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_invalid_syntax(client: Client) -> None:
-    """Test that invalid SPARQL syntax raises an error."""
-    with pytest.raises(ToolError):
-        await client.call_tool("rdf_sparql_query", {"query": "INVALID SPARQL SYNTAX"})
+    text = one_text(result)
+    assert "Graph Test Person" in text
 
 
-@pytest.mark.asyncio
 async def test_rdf_sparql_query_only_supports_read_operations(client: Client) -> None:
     """Test that rdf_sparql_query only supports read operations due to pyoxigraph query() API design.
 
@@ -169,25 +110,17 @@ async def test_rdf_sparql_query_only_supports_read_operations(client: Client) ->
     assert "expected construct" in error_msg or "syntax" in error_msg or "invalid" in error_msg
 
 
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_empty_query(client: Client) -> None:
-    """Test that empty SPARQL queries raise errors."""
-    with pytest.raises(ToolError):
-        await client.call_tool("rdf_sparql_query", {"query": ""})
-
-    with pytest.raises(ToolError):
-        await client.call_tool("rdf_sparql_query", {"query": "   "})
-
-
-@pytest.mark.asyncio
-async def test_rdf_sparql_query_completely_invalid_syntax(client: Client) -> None:
-    """Test various completely invalid SPARQL syntax."""
-    invalid_queries = [
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",  # Empty query
+        "   ",  # Whitespace only
         "INVALID SPARQL SYNTAX",
         "{ ?s ?p ?o",  # Missing closing brace
         "SELECT ?s WHERE",  # Incomplete WHERE clause
-    ]
-
-    for query in invalid_queries:
-        with pytest.raises(ToolError):
-            await client.call_tool("rdf_sparql_query", {"query": query})
+    ],
+)
+async def test_rdf_sparql_query_invalid_query(client: Client, query: str) -> None:
+    """Test that empty or syntactically invalid SPARQL queries raise errors."""
+    with pytest.raises(ToolError):
+        await client.call_tool("rdf_sparql_query", {"query": query})
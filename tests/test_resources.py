@@ -1,8 +1,24 @@
 """Tests for MCP resources functionality."""
 
-import pytest
+from typing import NamedTuple
+
 from fastmcp import Client
-from mcp.types import TextResourceContents
+from pyoxigraph import DefaultGraph, RdfFormat, parse
+
+from tests._helpers import read_text_resource
+
+# (subject, predicate, object, graph) term values; graph is None for the default graph
+Quad = tuple[str, str, str, str | None]
+
+
+class ParsedQuads(NamedTuple):
+    """Quads from one export, plus a column set per position for membership checks."""
+
+    quads: frozenset[Quad]
+    subjects: frozenset[str]
+    predicates: frozenset[str]
+    objects: frozenset[str]
+    graphs: frozenset[str | None]
 
 
 def find_resource_by_uri(resources, uri: str):
@@ -11,26 +27,38 @@ def find_resource_by_uri(resources, uri: str):
     return next((r for r in resources if str(r.uri) == uri), None)
 
 
-async def get_resource_content(client: Client, uri: str) -> str:
-    """Get content from a resource URI."""
+def parse_nquads(content: str) -> ParsedQuads:
+    """Parse N-Quads (or N-Triples) content once into (subject, predicate, object, graph) tuples and their columns.
+
+    pyoxigraph does the parsing, so typed and language-tagged literals and blank nodes are
+    handled like any other term, and literal values come back unescaped.
+    """
     __tracebackhide__ = True
-    result = await client.read_resource(uri)
-    assert len(result) == 1
-    assert isinstance(result[0], TextResourceContents)
-    return result[0].text
+    quads = {
+        (
+            quad.subject.value,
+            quad.predicate.value,
+            quad.object.value,
+            None if isinstance(quad.graph_name, DefaultGraph) else quad.graph_name.value,
+        )
+        for quad in parse(content, RdfFormat.N_QUADS)
+    }
+    return ParsedQuads(
+        quads=frozenset(quads),
+        subjects=frozenset(quad[0] for quad in quads),
+        predicates=frozenset(quad[1] for quad in quads),
+        objects=frozenset(quad[2] for quad in quads),
+        graphs=frozenset(quad[3] for quad in quads),
+    )
 
 
-def assert_quad_in_content(content: str, subject: str, predicate: str, obj: str, graph: str | None = None):
-    """Assert that a specific quad exists in N-Quads content."""
+def assert_quad_in_content(parsed: ParsedQuads, subject: str, predicate: str, obj: str, graph: str | None = None):
+    """Assert that a specific quad exists in parsed N-Quads content."""
     __tracebackhide__ = True
-    if graph:
-        expected_quad = f'<{subject}> <{predicate}> "{obj}" <{graph}> .'
-    else:
-        expected_quad = f'<{subject}> <{predicate}> "{obj}" .'
-    assert expected_quad in content, f"Expected quad not found: {expected_quad}"
+    expected_quad = (subject, predicate, obj, graph)
+    assert expected_quad in parsed.quads, f"Expected quad not found: {expected_quad}"
 
 
-@pytest.mark.asyncio
 async def test_export_all_resource_available(client: Client):
     """Test that the export_all_triples resource is available."""
     resources = await client.list_resources()
@@ -43,15 +71,13 @@ async def test_export_all_resource_available(client: Client):
     assert "Export all RDF data from the triple store" in export_resource.description
 
 
-@pytest.mark.asyncio
 async def test_export_empty_store(client: Client):
     """Test exporting when the store is empty."""
     # Read the resource
-    content = await get_resource_content(client, "rdf://graph")
+    content = await read_text_resource(client, "rdf://graph")
     assert content == ""  # Empty store should return empty string
 
 
-@pytest.mark.asyncio
 async def test_export_with_data(client: Client):
     """Test exporting when the store contains data."""
     # Add some test data
@@ -75,20 +101,18 @@ async def test_export_with_data(client: Client):
     )
 
     # Read the export resource
-    content = await get_resource_content(client, "rdf://graph")
+    content = await read_text_resource(client, "rdf://graph")
+    parsed = parse_nquads(content)
 
-    # Parse N-Quads format
-    lines = content.strip().split("\n")
-    assert len(lines) == 2
+    assert len(parsed.quads) == 2
 
     # Check that both quads are present with correct format
-    assert_quad_in_content(content, "http://example.org/alice", "http://xmlns.com/foaf/0.1/name", "Alice")
+    assert_quad_in_content(parsed, "http://example.org/alice", "http://xmlns.com/foaf/0.1/name", "Alice")
     assert_quad_in_content(
-        content, "http://example.org/bob", "http://xmlns.com/foaf/0.1/name", "Bob", "http://mcp.local/people"
+        parsed, "http://example.org/bob", "http://xmlns.com/foaf/0.1/name", "Bob", "http://mcp.local/people"
     )
 
 
-@pytest.mark.asyncio
 async def test_export_preserves_literal_types(client: Client):
     """Test that export preserves different literal types."""
     # Add triples with different literal types
@@ -116,16 +140,17 @@ async def test_export_preserves_literal_types(client: Client):
     )
 
     # Read the export
-    content = await get_resource_content(client, "rdf://graph")
+    content = await read_text_resource(client, "rdf://graph")
+    parsed = parse_nquads(content)
 
     # Check all literals are properly serialized
-    assert_quad_in_content(content, "http://example.org/test", "http://example.org/text", "Plain text")
-    assert_quad_in_content(content, "http://example.org/test", "http://example.org/unicode", "Unicode: 你好世界 🌍")
-    # N-Quads escapes newlines - check manually since it's complex
-    assert '"Line 1\\nLine 2\\nLine 3"' in content
+    assert_quad_in_content(parsed, "http://example.org/test", "http://example.org/text", "Plain text")
+    assert_quad_in_content(parsed, "http://example.org/test", "http://example.org/unicode", "Unicode: 你好世界 🌍")
+    # N-Quads escapes newlines on export, and parsing restores the original value
+    assert "Line 1\\nLine 2\\nLine 3" in content
+    assert_quad_in_content(parsed, "http://example.org/test", "http://example.org/multiline", "Line 1\nLine 2\nLine 3")
 
 
-@pytest.mark.asyncio
 async def test_export_multiple_graphs(client: Client):
     """Test exporting data from multiple named graphs."""
     # Add data to multiple graphs
@@ -155,25 +180,22 @@ async def test_export_multiple_graphs(client: Client):
     )
 
     # Read the export
-    content = await get_resource_content(client, "rdf://graph")
+    content = await read_text_resource(client, "rdf://graph")
+    parsed = parse_nquads(content)
 
     # Check all quads are present with correct format
-    assert_quad_in_content(content, "http://example.org/default", "http://example.org/in", "default graph")
+    assert_quad_in_content(parsed, "http://example.org/default", "http://example.org/in", "default graph")
     assert_quad_in_content(
-        content, "http://example.org/graph1", "http://example.org/in", "graph 1", "http://mcp.local/graph1"
+        parsed, "http://example.org/graph1", "http://example.org/in", "graph 1", "http://mcp.local/graph1"
     )
     assert_quad_in_content(
-        content, "http://example.org/graph2", "http://example.org/in", "graph 2", "http://mcp.local/graph2"
+        parsed, "http://example.org/graph2", "http://example.org/in", "graph 2", "http://mcp.local/graph2"
     )
 
-    # Verify N-Quads format
-    lines = content.strip().split("\n")
-    assert len(lines) == 3
-    for line in lines:
-        assert line.endswith(".")
+    # Every line parsed as a well-formed quad
+    assert len(parsed.quads) == 3
 
 
-@pytest.mark.asyncio
 async def test_export_named_graph(client: Client):
     """Test exporting a specific named graph."""
     # Add data to multiple graphs
@@ -198,20 +220,21 @@ async def test_export_named_graph(client: Client):
     )
 
     # Read just the people graph
-    content = await get_resource_content(client, "rdf://graph/people")
+    content = await read_text_resource(client, "rdf://graph/people")
+    parsed = parse_nquads(content)
 
     # Should only contain Alice as a triple (no graph part when exporting single graph)
-    assert_quad_in_content(content, "http://example.org/alice", "http://xmlns.com/foaf/0.1/name", "Alice")
+    assert_quad_in_content(parsed, "http://example.org/alice", "http://xmlns.com/foaf/0.1/name", "Alice")
 
     # Should NOT contain Bob (he's in the 'other' graph)
-    assert "Bob" not in content
-    assert "<http://example.org/bob>" not in content
+    assert ("http://example.org/bob", "http://xmlns.com/foaf/0.1/name", "Bob", None) not in parsed.quads
+    assert not any("Bob" in obj for obj in parsed.objects)
+    assert not any("bob" in subject for subject in parsed.subjects)
 
     # When exporting a specific graph, it becomes triples (no graph part)
     # This is expected behavior when exporting from a single graph
 
 
-@pytest.mark.asyncio
 async def test_export_named_graph_detailed(client: Client):
     """Test exporting a named graph in detail."""
     # Add data to a named graph
@@ -230,14 +253,14 @@ async def test_export_named_graph_detailed(client: Client):
     )
 
     # Export the named graph
-    content = await get_resource_content(client, "rdf://graph/people")
+    content = await read_text_resource(client, "rdf://graph/people")
+    parsed = parse_nquads(content)
 
     # Should contain the data as a triple (single graph export)
-    assert_quad_in_content(content, "http://example.org/alice", "http://xmlns.com/foaf/0.1/name", "Alice")
+    assert_quad_in_content(parsed, "http://example.org/alice", "http://xmlns.com/foaf/0.1/name", "Alice")
     assert content.strip().endswith(".")  # N-Triples format ends with period
 
 
-@pytest.mark.asyncio
 async def test_resource_templates_available(client: Client):
     """Test that the expected resource templates are available."""
     # List resource templates
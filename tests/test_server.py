@@ -3,16 +3,17 @@ General server tests - basic functionality and integration.
 """
 
 import pytest
+import pytest_asyncio
 from fastmcp import Client
 
 
-@pytest.mark.asyncio
-async def test_server_tools_available(client: Client) -> None:
-    """Test that the server has the expected tools."""
-    tools = await client.list_tools()
-    tool_names = [tool.name for tool in tools]
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def listed_tool_names(client: Client) -> frozenset[str]:
+    """Provide the tool names the server advertises over the MCP protocol, listed once."""
+    return frozenset(tool.name for tool in await client.list_tools())
 
-    # Check all expected tools are present
-    expected_tools = ["rdf_add_triples", "rdf_find_triples", "rdf_sparql_query"]
-    for tool in expected_tools:
-        assert tool in tool_names
+
+@pytest.mark.parametrize("tool", ["rdf_define_prefix", "rdf_add_triples", "rdf_find_triples", "rdf_sparql_query"])
+async def test_server_tools_available(listed_tool_names: frozenset[str], tool: str) -> None:
+    """Test that the server advertises each expected tool over the MCP protocol."""
+    assert tool in listed_tool_names
@@ -8,23 +8,13 @@ According to SPARQL 1.1 specification (https://www.w3.org/TR/sparql11-query/):
 This test documents that pyoxigraph correctly follows the SPARQL 1.1 grammar.
 """
 
-import json
-
 import pytest
 from fastmcp.client.client import Client
 from fastmcp.exceptions import ToolError
-from mcp.types import TextContent
-
 
-def parse_sparql_result(result) -> list[dict[str, str]]:
-    """Parse SPARQL query result with proper type checking."""
-    __tracebackhide__ = True
-    assert len(result) == 1, "Expected exactly one result"
-    assert isinstance(result[0], TextContent), f"Expected TextContent but got {type(result[0])}"
-    return json.loads(result[0].text)
+from tests._helpers import parse_sparql_result
 
 
-@pytest.mark.asyncio
 async def test_sparql_forward_slash_invalid(client: Client):
     """Test that unescaped forward slashes in prefixed names are invalid per SPARQL 1.1."""
     # Define prefixes
@@ -55,7 +45,6 @@ SELECT ?o WHERE {
     assert "error at" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_sparql_forward_slash_escaped(client: Client):
     """Test that escaped forward slashes in prefixed names are valid per SPARQL 1.1."""
     # Define prefixes
@@ -86,7 +75,6 @@ SELECT ?o WHERE {
     assert "http://example.org/file/include/header.h" in data[0]["o"]
 
 
-@pytest.mark.asyncio
 async def test_sparql_forward_slash_full_iri(client: Client):
     """Test that full IRIs with forward slashes work correctly."""
     # Define prefixes for data insertion
@@ -115,7 +103,6 @@ async def test_sparql_forward_slash_full_iri(client: Client):
     assert "http://example.org/file/include/header.h" in data[0]["o"]
 
 
-@pytest.mark.asyncio
 async def test_sparql_alternative_separators(client: Client):
     """Test using alternative separators instead of forward slashes."""
     # Define prefix